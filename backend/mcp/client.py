@@ -2,24 +2,95 @@
 MCP Client implementation with OpenAI integration
 """
 
+import asyncio
 import json
+import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 import openai
+import orjson
+
+# Plain "a <op> b" arithmetic is answered by the calculator tool directly
+_ARITHMETIC_RE = re.compile(
+    r"^\s*([-+]?\d+(?:\.\d+)?)\s*([+\-*/])\s*([-+]?\d+(?:\.\d+)?)\s*$"
+)
+_ARITHMETIC_OPS = {"+": "add", "-": "subtract", "*": "multiply", "/": "divide"}
+
+# Longer argument strings are parsed directly to keep the cache small
+_MAX_CACHED_ARGS_LEN = 2048
+
+
+def _loads_args(arguments: str) -> Dict[str, Any]:
+    """
+    Decode tool-call arguments with orjson. Falls back to stdlib json, which
+    also accepts NaN/Infinity literals that orjson rejects.
+    """
+    try:
+        return orjson.loads(arguments)
+    except orjson.JSONDecodeError:
+        return json.loads(arguments)
+
+
+@lru_cache(maxsize=256)
+def _parse_args_cached(arguments: str) -> Dict[str, Any]:
+    return _loads_args(arguments)
+
+
+def _parse_args(arguments: str) -> Dict[str, Any]:
+    """
+    Parse tool-call arguments, memoizing repeated strings.
+    The returned dict may be shared and must not be mutated.
+    """
+    if len(arguments) > _MAX_CACHED_ARGS_LEN:
+        return _loads_args(arguments)
+    return _parse_args_cached(arguments)
+
+
+def _encode_result(result: Any) -> str:
+    """Encode a tool result for the history, falling back to stdlib json"""
+    try:
+        return orjson.dumps(result).decode()
+    except (orjson.JSONEncodeError, TypeError):
+        return json.dumps(result, default=str)
+
+
+def _parse_number(text: str):
+    return float(text) if "." in text else int(text)
+
 
 class MCPClient:
     """
     MCP Client that connects to an MCP server and uses OpenAI for LLM interaction.
     """
 
+    _SYSTEM_PROMPT = """You are a helpful AI assistant with access to real-time tools.
+
+    IMPORTANT: You have access to these tools and MUST use them when appropriate:
+    - get_weather: For ANY weather-related questions, ALWAYS use this tool
+    - calculator: For mathematical calculations
+    - read_file: For reading file contents
+
+    When a user asks about weather, current conditions, temperature, or forecasts:
+    1. DO NOT say you cannot access real-time data
+    2. ALWAYS call the get_weather tool
+    3. Use the tool's response to answer the question
+
+    Never refuse to get weather information - you have a working weather tool!"""
+
+    _SYSTEM_MSG = {"role": "system", "content": _SYSTEM_PROMPT}
+
     def __init__(self, api_key: str, server):
         self.client = openai.OpenAI(api_key=api_key)
         self.server = server
-        self.conversation_history: List[Dict[str, Any]] = []
+        self.conversation_history: List[Dict[str, Any]] = [self._SYSTEM_MSG]
         self.tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._openai_tools: List[Dict[str, Any]] = []
+        self.max_history_messages = 40
 
     async def initialize(self):
         """Initialize the client by fetching available tools"""
         self.tools_cache = await self.server.list_tools()
+        self._rebuild_openai_tools()
         print(f"Initialized MCP client with {len(self.tools_cache)} tools")
 
     def _convert_tools_to_openai_format(self) -> List[Dict[str, Any]]:
@@ -36,68 +107,98 @@ class MCPClient:
             for tool in self.tools_cache
         ]
 
-    async def chat(self, user_message: str, max_iterations: int = 5) -> str:
+    def _rebuild_openai_tools(self):
+        """Refresh the cached OpenAI tool definitions from tools_cache"""
+        self._openai_tools = self._convert_tools_to_openai_format()
+
+    def _trim_history(self):
         """
-        Send a message and handle tool calls in an agentic loop.
+        Keep the system prompt plus the most recent messages so the request
+        payload stays bounded. Never leaves tool results without the
+        assistant message that requested them.
         """
-        
-        # Add system message if this is the first message
-        if len(self.conversation_history) == 0:
-            self.conversation_history.append({
-                "role": "system",
-                "content": """You are a helpful AI assistant with access to real-time tools.
+        history = self.conversation_history
+        start = 1 if history and history[0]["role"] == "system" else 0
+
+        excess = len(history) - start - self.max_history_messages
+        if excess <= 0:
+            return
+
+        cut = start + excess
+        if history[cut]["role"] == "tool":
+            end = cut
+            while end < len(history) and history[end]["role"] == "tool":
+                end += 1
+
+            if end < len(history):
+                cut = end
+            else:
+                # The group is still pending; keep it with its assistant message
+                while cut > start and history[cut]["role"] == "tool":
+                    cut -= 1
+
+        del history[start:cut]
+
+    async def _try_arithmetic_shortcut(self, user_message: str) -> Optional[str]:
+        """Answer "a <op> b" messages via the calculator tool, or return None"""
+        match = _ARITHMETIC_RE.match(user_message)
+        if not match:
+            return None
+
+        a, symbol, b = match.groups()
+        result = await self.server.call_tool("calculator", {
+            "operation": _ARITHMETIC_OPS[symbol],
+            "a": _parse_number(a),
+            "b": _parse_number(b)
+        })
 
-    IMPORTANT: You have access to these tools and MUST use them when appropriate:
-    - get_weather: For ANY weather-related questions, ALWAYS use this tool
-    - calculator: For mathematical calculations
-    - read_file: For reading file contents
+        if not result.get("success"):
+            return None
 
-    When a user asks about weather, current conditions, temperature, or forecasts:
-    1. DO NOT say you cannot access real-time data
-    2. ALWAYS call the get_weather tool
-    3. Use the tool's response to answer the question
+        value = result["result"]
+        if isinstance(value, float):
+            # Trim binary rounding noise such as 0.30000000000000004
+            value = format(value, ".15g")
 
-    Never refuse to get weather information - you have a working weather tool!"""
-            })
-        
+        return f"{a} {symbol} {b} = {value}"
+
+    async def chat(self, user_message: str, max_iterations: int = 5) -> str:
+        """
+        Send a message and handle tool calls in an agentic loop.
+        """
         # Add user message to history
         self.conversation_history.append({
             "role": "user",
             "content": user_message
         })
 
+        # Skip the LLM round-trip for trivial arithmetic
+        shortcut = await self._try_arithmetic_shortcut(user_message)
+        if shortcut is not None:
+            self.conversation_history.append({
+                "role": "assistant",
+                "content": shortcut
+            })
+            return shortcut
+
         iteration = 0
 
         while iteration < max_iterations:
             iteration += 1
+            self._trim_history()
 
             response = self.client.chat.completions.create(
                 model="gpt-4o",
                 messages=self.conversation_history,
-                tools=self._convert_tools_to_openai_format(),
+                tools=self._openai_tools,
                 tool_choice="auto"
             )
 
             message = response.choices[0].message
 
-            # Add assistant's response
-            msg_dict = {
-                "role": "assistant",
-                "content": message.content
-            }
-
-            if message.tool_calls:
-                msg_dict["tool_calls"] = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments
-                        }
-                    }
-                    for tc in message.tool_calls
-                ]
+            # Add assistant's response in the SDK's canonical message format
+            msg_dict = message.model_dump(exclude_none=True)
+            msg_dict["role"] = "assistant"
 
             self.conversation_history.append(msg_dict)
 
@@ -105,23 +206,42 @@ class MCPClient:
             if not message.tool_calls:
                 return message.content or "No response generated"
 
-            # Process tool calls
-            for tool_call in message.tool_calls:
-                function_name = tool_call.function.name
-                function_args = json.loads(tool_call.function.arguments)
-
-                # Execute tool via MCP server
-                result = await self.server.call_tool(function_name, function_args)
+            # Parse each call's arguments separately so a malformed call still
+            # gets a tool reply; only well-formed calls are dispatched
+            results: List[Any] = [None] * len(message.tool_calls)
+            calls = {}
+            for i, tool_call in enumerate(message.tool_calls):
+                try:
+                    args = _parse_args(tool_call.function.arguments)
+                except (ValueError, TypeError) as e:
+                    results[i] = {
+                        "success": False,
+                        "error": f"Invalid tool arguments: {e}"
+                    }
+                else:
+                    calls[i] = self.server.call_tool(tool_call.function.name, args)
+
+            # Process tool calls concurrently; gather preserves order
+            outcomes = await asyncio.gather(*calls.values(), return_exceptions=True)
+            for i, outcome in zip(calls, outcomes):
+                results[i] = outcome
+
+            for tool_call, result in zip(message.tool_calls, results):
+                if isinstance(result, BaseException):
+                    result = {
+                        "success": False,
+                        "error": str(result)
+                    }
 
                 # Add tool result to history
                 self.conversation_history.append({
                     "role": "tool",
                     "tool_call_id": tool_call.id,
-                    "content": json.dumps(result)
+                    "content": _encode_result(result)
                 })
 
         return "Max iterations reached without final answer"
 
     def reset_conversation(self):
         """Clear conversation history"""
-        self.conversation_history = []
\ No newline at end of file
+        self.conversation_history = [self._SYSTEM_MSG]
\ No newline at end of file
@@ -5,14 +5,14 @@ Data models for MCP
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Tool:
     """Represents an MCP tool definition"""
     name: str
     description: str
     input_schema: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Resource:
     """Represents an MCP resource"""
     uri: str
@@ -20,14 +20,14 @@ class Resource:
     description: str
     mime_type: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolCall:
     """Represents a tool call from the LLM"""
     id: str
     name: str
     arguments: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolResult:
     """Represents the result of a tool execution"""
     success: bool
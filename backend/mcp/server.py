@@ -2,7 +2,8 @@
 MCP Server implementation
 """
 
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Dict, List, Optional
 from .models import Tool, ToolResult
 from .tools.calculator import CalculatorTool
 from .tools.weather import WeatherTool
@@ -16,8 +17,12 @@ class MCPServer:
     Extensible architecture for adding new tools.
     """
 
-    def __init__(self):
+    def __init__(self, max_concurrent: int = 8):
         self.tools: Dict[str, Any] = {}
+        # Caps in-flight tool executions so parallel tool calls don't
+        # overwhelm rate-limited upstream APIs
+        self._sem = asyncio.Semaphore(max_concurrent)
+        self._tools_snapshot: Optional[List[Dict[str, Any]]] = None
         self._initialize_tools()
 
     def _initialize_tools(self):
@@ -36,18 +41,21 @@ class MCPServer:
     def register_tool(self, tool):
         """Register a new tool with the server"""
         self.tools[tool.name] = tool
+        self._tools_snapshot = None
         print(f"Registered tool: {tool.name}")
 
     async def list_tools(self) -> List[Dict[str, Any]]:
-        """List all available tools"""
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.input_schema
-            }
-            for tool in self.tools.values()
-        ]
+        """List all available tools (cached until the next registration)"""
+        if self._tools_snapshot is None:
+            self._tools_snapshot = [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "input_schema": tool.input_schema
+                }
+                for tool in self.tools.values()
+            ]
+        return self._tools_snapshot
 
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a tool call"""
@@ -59,7 +67,8 @@ class MCPServer:
 
         try:
             tool = self.tools[name]
-            result = await tool.execute(arguments)
+            async with self._sem:
+                result = await tool.execute(arguments)
             return result
         except Exception as e:
             return {
@@ -2,9 +2,17 @@
 Calculator tool implementation
 """
 
+import operator
 from typing import Any, Dict
 from .base import BaseTool
 
+_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv
+}
+
 class CalculatorTool(BaseTool):
     """Calculator tool for basic arithmetic operations"""
 
@@ -31,30 +39,31 @@ class CalculatorTool(BaseTool):
         """Execute calculator operation"""
         try:
             operation = arguments["operation"]
-            a = float(arguments["a"])
-            b = float(arguments["b"])
+            a = arguments["a"]
+            b = arguments["b"]
 
-            operations = {
-                "add": lambda x, y: x + y,
-                "subtract": lambda x, y: x - y,
-                "multiply": lambda x, y: x * y,
-                "divide": lambda x, y: x / y if y != 0 else None
-            }
+            # JSON numbers already arrive as int/float; keep integer math exact
+            if not isinstance(a, (int, float)):
+                a = float(a)
+            if not isinstance(b, (int, float)):
+                b = float(b)
+
+            op = _OPS.get(operation)
 
-            if operation not in operations:
+            if op is None:
                 return {
                     "success": False,
                     "error": f"Unknown operation: {operation}"
                 }
 
-            result = operations[operation](a, b)
-
-            if result is None:
+            if operation == "divide" and b == 0:
                 return {
                     "success": False,
                     "error": "Division by zero"
                 }
 
+            result = op(a, b)
+
             return {
                 "success": True,
                 "result": result,
@@ -31,12 +31,13 @@ class FileOpsTool(BaseTool):
             "notes.md": "# Notes\n\n## Project Ideas\n- Build MCP tools\n- Create UI",
             "users.csv": "id,name,email\n1,John Doe,john@example.com\n2,Jane Smith,jane@example.com"
         }
+        self._file_sizes = {name: len(content) for name, content in self.mock_files.items()}
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Read a file"""
         try:
             path = arguments["path"]
-            filename = path.split("/")[-1]
+            filename = path.rsplit("/", 1)[-1]
 
             if filename not in self.mock_files:
                 return {
@@ -48,7 +49,7 @@ class FileOpsTool(BaseTool):
                 "success": True,
                 "path": path,
                 "content": self.mock_files[filename],
-                "size": len(self.mock_files[filename])
+                "size": self._file_sizes[filename]
             }
 
         except Exception as e:
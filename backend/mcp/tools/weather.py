@@ -3,12 +3,28 @@ Weather tool implementation with real API integration
 Supports multiple weather APIs: OpenWeatherMap, WeatherAPI, and Visual Crossing
 """
 
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 from .base import BaseTool
 import os
+import time
 import httpx
 import asyncio
 
+# Fallback data served when no API key is configured
+_MOCK_WEATHER = {
+    "london": {"temp": 15, "condition": "Cloudy", "humidity": 65},
+    "paris": {"temp": 18, "condition": "Sunny", "humidity": 50},
+    "new york": {"temp": 22, "condition": "Partly cloudy", "humidity": 55},
+    "tokyo": {"temp": 25, "condition": "Clear", "humidity": 45},
+    "sydney": {"temp": 28, "condition": "Sunny", "humidity": 60},
+    "berlin": {"temp": 12, "condition": "Rainy", "humidity": 80},
+    "dubai": {"temp": 35, "condition": "Sunny", "humidity": 40},
+    "mumbai": {"temp": 30, "condition": "Humid", "humidity": 75},
+    "cairo": {"temp": 32, "condition": "Clear", "humidity": 30},
+    "moscow": {"temp": 5, "condition": "Snow", "humidity": 70}
+}
+
 class WeatherTool(BaseTool):
     """Weather information tool using real weather APIs"""
 
@@ -52,14 +68,46 @@ class WeatherTool(BaseTool):
         
         self.api_key = api_key or os.getenv("WEATHER_API_KEY")
         self.provider = provider.lower()
+
+        # Per-provider request constants; only city/units vary between calls
+        self._owm_url = "https://api.openweathermap.org/data/2.5/weather"
+        self._owm_base_params = {"appid": self.api_key}
+        self._weatherapi_url = "http://api.weatherapi.com/v1/current.json"
+        self._weatherapi_base_params = {"key": self.api_key, "aqi": "no"}
+        self._vc_base_params = {"key": self.api_key, "include": "current", "contentType": "json"}
+
+        # Provider is fixed after init, so resolve its fetch method once
+        self._fetch = {
+            "openweathermap": self._fetch_openweathermap,
+            "weatherapi": self._fetch_weatherapi,
+            "visualcrossing": self._fetch_visualcrossing
+        }.get(self.provider)
         
         if not self.api_key:
             print("⚠️  Warning: No WEATHER_API_KEY found. Weather tool will return mock data.")
             print("   Set WEATHER_API_KEY environment variable or pass api_key parameter.")
             print(f"   Get a free API key from: {self._get_signup_url()}")
         
-        # HTTP client with timeout
-        self.client = httpx.AsyncClient(timeout=10.0)
+        # Shared HTTP/2 client; keep-alive pool amortizes TLS handshakes across calls
+        self.client = httpx.AsyncClient(
+            timeout=10.0,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=40,
+                keepalive_expiry=60.0
+            )
+        )
+
+        # Short-lived response cache keyed by (provider, city, units), kept in
+        # write order so expired and oldest entries are evicted from the front.
+        # The per-key locks coalesce concurrent lookups into a single API call
+        # and are dropped once no request is using them.
+        self._cache: "OrderedDict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_locks: Dict[Tuple[str, str, str], asyncio.Lock] = {}
+        self._cache_lock_users: Dict[Tuple[str, str, str], int] = {}
+        self._cache_ttl = 120.0
+        self._cache_max_size = 256
 
     def _get_signup_url(self) -> str:
         """Get signup URL for the selected provider"""
@@ -75,14 +123,9 @@ class WeatherTool(BaseTool):
         # Convert units
         api_units = "metric" if units == "celsius" else "imperial"
         
-        url = "https://api.openweathermap.org/data/2.5/weather"
-        params = {
-            "q": city,
-            "appid": self.api_key,
-            "units": api_units
-        }
+        params = {**self._owm_base_params, "q": city, "units": api_units}
         
-        response = await self.client.get(url, params=params)
+        response = await self.client.get(self._owm_url, params=params)
         response.raise_for_status()
         data = response.json()
         
@@ -106,14 +149,9 @@ class WeatherTool(BaseTool):
 
     async def _fetch_weatherapi(self, city: str, units: str) -> Dict[str, Any]:
         """Fetch weather from WeatherAPI.com"""
-        url = "http://api.weatherapi.com/v1/current.json"
-        params = {
-            "key": self.api_key,
-            "q": city,
-            "aqi": "no"
-        }
+        params = {**self._weatherapi_base_params, "q": city}
         
-        response = await self.client.get(url, params=params)
+        response = await self.client.get(self._weatherapi_url, params=params)
         response.raise_for_status()
         data = response.json()
         
@@ -146,12 +184,7 @@ class WeatherTool(BaseTool):
         unit_group = "us" if units == "fahrenheit" else "metric"
         
         url = f"https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline/{city}"
-        params = {
-            "key": self.api_key,
-            "unitGroup": unit_group,
-            "include": "current",
-            "contentType": "json"
-        }
+        params = {**self._vc_base_params, "unitGroup": unit_group}
         
         response = await self.client.get(url, params=params)
         response.raise_for_status()
@@ -180,28 +213,15 @@ class WeatherTool(BaseTool):
 
     async def _fetch_mock_data(self, city: str, units: str) -> Dict[str, Any]:
         """Fallback mock data when no API key is available"""
-        mock_data = {
-            "london": {"temp": 15, "condition": "Cloudy", "humidity": 65},
-            "paris": {"temp": 18, "condition": "Sunny", "humidity": 50},
-            "new york": {"temp": 22, "condition": "Partly cloudy", "humidity": 55},
-            "tokyo": {"temp": 25, "condition": "Clear", "humidity": 45},
-            "sydney": {"temp": 28, "condition": "Sunny", "humidity": 60},
-            "berlin": {"temp": 12, "condition": "Rainy", "humidity": 80},
-            "dubai": {"temp": 35, "condition": "Sunny", "humidity": 40},
-            "mumbai": {"temp": 30, "condition": "Humid", "humidity": 75},
-            "cairo": {"temp": 32, "condition": "Clear", "humidity": 30},
-            "moscow": {"temp": 5, "condition": "Snow", "humidity": 70}
-        }
-        
         city_lower = city.split(",")[0].lower().strip()
         
-        if city_lower not in mock_data:
+        if city_lower not in _MOCK_WEATHER:
             return {
                 "success": False,
                 "error": f"Mock weather data not available for '{city}'. Please set WEATHER_API_KEY for real data."
             }
         
-        data = mock_data[city_lower]
+        data = _MOCK_WEATHER[city_lower]
         temp = data["temp"]
         
         if units == "fahrenheit":
@@ -218,6 +238,48 @@ class WeatherTool(BaseTool):
             "note": "This is mock data. Get real weather by setting WEATHER_API_KEY environment variable."
         }
 
+    async def _fetch_cached(self, city: str, units: str) -> Dict[str, Any]:
+        """Fetch weather, reusing a recent successful response for the same city"""
+        key = (self.provider, city.lower(), units)
+
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        lock = self._cache_locks.get(key)
+        if lock is None:
+            lock = self._cache_locks[key] = asyncio.Lock()
+        self._cache_lock_users[key] = self._cache_lock_users.get(key, 0) + 1
+
+        try:
+            async with lock:
+                # Another request may have filled the cache while we waited
+                cached = self._cache.get(key)
+                if cached and time.monotonic() - cached[0] < self._cache_ttl:
+                    return cached[1]
+
+                result = await self._fetch(city, units)
+                if result.get("success"):
+                    self._store_cached(key, result)
+                return result
+        finally:
+            self._cache_lock_users[key] -= 1
+            if self._cache_lock_users[key] == 0:
+                del self._cache_lock_users[key]
+                del self._cache_locks[key]
+
+    def _store_cached(self, key: Tuple[str, str, str], result: Dict[str, Any]):
+        """Store a response, evicting expired entries and enforcing the size cap"""
+        now = time.monotonic()
+        self._cache[key] = (now, result)
+        self._cache.move_to_end(key)
+
+        while self._cache:
+            oldest_key, (stored_at, _) = next(iter(self._cache.items()))
+            if now - stored_at < self._cache_ttl and len(self._cache) <= self._cache_max_size:
+                break
+            del self._cache[oldest_key]
+
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Get weather for a city using real API"""
         try:
@@ -228,19 +290,15 @@ class WeatherTool(BaseTool):
             if not self.api_key:
                 return await self._fetch_mock_data(city, units)
             
+            if self._fetch is None:
+                return {
+                    "success": False,
+                    "error": f"Unknown provider: {self.provider}. Use 'openweathermap', 'weatherapi', or 'visualcrossing'"
+                }
+
             # Try to fetch from selected provider
             try:
-                if self.provider == "openweathermap":
-                    return await self._fetch_openweathermap(city, units)
-                elif self.provider == "weatherapi":
-                    return await self._fetch_weatherapi(city, units)
-                elif self.provider == "visualcrossing":
-                    return await self._fetch_visualcrossing(city, units)
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Unknown provider: {self.provider}. Use 'openweathermap', 'weatherapi', or 'visualcrossing'"
-                    }
+                return await self._fetch_cached(city, units)
             
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 401:
@@ -276,17 +334,10 @@ class WeatherTool(BaseTool):
                 "error": f"Error getting weather: {str(e)}"
             }
     
-    async def close(self):
+    async def aclose(self):
         """Close HTTP client"""
         await self.client.aclose()
 
-    def __del__(self):
-        """Cleanup on deletion"""
-        try:
-            asyncio.create_task(self.close())
-        except:
-            pass
-
 
 # =============================================================================
 # USAGE EXAMPLES
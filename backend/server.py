@@ -4,6 +4,7 @@ Main FastAPI server for MCP project
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional
 import sys
@@ -15,7 +16,7 @@ from config import config
 from backend.mcp.server import MCPServer
 from backend.mcp.client import MCPClient
 
-app = FastAPI(title="MCP Server", version="1.0.0")
+app = FastAPI(title="MCP Server", version="1.0.0", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -49,6 +50,12 @@ async def startup_event():
     await mcp_client.initialize()
     print(f"MCP Server started with {len(mcp_server.tools)} tools")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    for tool in mcp_server.tools.values():
+        if hasattr(tool, "aclose"):
+            await tool.aclose()
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "version": "1.0.0"}
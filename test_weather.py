@@ -17,231 +17,279 @@ import httpx
 import os
 import sys
 import json
+import time
 from dotenv import load_dotenv
 from typing import Dict, Any, Optional
-from datetime import datetime
 
-load_dotenv()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson else json.loads
+
+load_dotenv(override=False)
+
+_WEATHER_API_KEY = os.environ.get("WEATHER_API_KEY")
+
+# Maps separators in city names to underscores for result filenames
+_CITY_XLAT = str.maketrans({' ': '_', '-': '_'})
 
 # ANSI color codes for pretty output
-class Colors:
-    HEADER = '\033[95m'
-    OKBLUE = '\033[94m'
-    OKCYAN = '\033[96m'
-    OKGREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
+HEADER = '\033[95m'
+OKBLUE = '\033[94m'
+OKCYAN = '\033[96m'
+OKGREEN = '\033[92m'
+WARNING = '\033[93m'
+FAIL = '\033[91m'
+ENDC = '\033[0m'
+BOLD = '\033[1m'
+UNDERLINE = '\033[4m'
+
+# Drop escape codes when output is piped to a file or CI log
+if not sys.stdout.isatty():
+    HEADER = OKBLUE = OKCYAN = OKGREEN = WARNING = FAIL = ENDC = BOLD = UNDERLINE = ''
+
+
+# Prebuilt message templates
+_SUCCESS_FMT = f"{OKGREEN}✓ %s{ENDC}"
+_ERR_FMT = f"{FAIL}✗ %s{ENDC}"
+_WARN_FMT = f"{WARNING}⚠ %s{ENDC}"
+_INFO_FMT = f"{OKCYAN}ℹ %s{ENDC}"
+_HEADER_FMT = f"{HEADER}{BOLD}%s{ENDC}"
+_HEADER_SEP = HEADER + BOLD + ("=" * 80) + ENDC
+
+
+# HTTP client shared by all tester instances so keep-alive connections are reused
+_SHARED_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use"""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        _SHARED_CLIENT = httpx.AsyncClient(
+            timeout=15.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+            headers={"accept-encoding": "gzip, br"}
+        )
+    return _SHARED_CLIENT
+
+
+async def aclose_shared():
+    """Close the shared HTTP client"""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is not None:
+        await _SHARED_CLIENT.aclose()
+        _SHARED_CLIENT = None
+
+
+def _parse_openweathermap(data: Dict[str, Any], units: str) -> Dict[str, Any]:
+    t = time.localtime(data["dt"])
+    return {
+        "success": True,
+        "provider": "OpenWeatherMap",
+        "city": data["name"],
+        "country": data["sys"]["country"],
+        "temperature": round(data["main"]["temp"], 1),
+        "feels_like": round(data["main"]["feels_like"], 1),
+        "units": units,
+        "condition": data["weather"][0]["description"].title(),
+        "humidity": data["main"]["humidity"],
+        "pressure": data["main"]["pressure"],
+        "wind_speed": round(data["wind"]["speed"], 1),
+        "clouds": data["clouds"]["all"],
+        "visibility": data.get("visibility", "N/A"),
+        "timestamp": f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+    }
+
+
+def _parse_weatherapi(data: Dict[str, Any], units: str) -> Dict[str, Any]:
+    current = data["current"]
+    celsius = units == "celsius"
+    return {
+        "success": True,
+        "provider": "WeatherAPI",
+        "city": data["location"]["name"],
+        "country": data["location"]["country"],
+        "region": data["location"]["region"],
+        "temperature": round(current["temp_c"] if celsius else current["temp_f"], 1),
+        "feels_like": round(current["feelslike_c"] if celsius else current["feelslike_f"], 1),
+        "units": units,
+        "condition": current["condition"]["text"],
+        "humidity": current["humidity"],
+        "pressure": current["pressure_mb"],
+        "wind_speed": round(current["wind_kph"] if celsius else current["wind_mph"], 1),
+        "wind_direction": current["wind_dir"],
+        "clouds": current["cloud"],
+        "visibility": current["vis_km"] if celsius else current["vis_miles"],
+        "uv_index": current["uv"],
+        "last_updated": current["last_updated"]
+    }
+
+
+def _parse_visualcrossing(data: Dict[str, Any], units: str) -> Dict[str, Any]:
+    current = data["currentConditions"]
+    return {
+        "success": True,
+        "provider": "Visual Crossing",
+        "city": data["resolvedAddress"],
+        "temperature": round(current["temp"], 1),
+        "feels_like": round(current["feelslike"], 1),
+        "units": units,
+        "condition": current["conditions"],
+        "humidity": current["humidity"],
+        "pressure": current["pressure"],
+        "wind_speed": round(current["windspeed"], 1),
+        "wind_direction": current.get("winddir", "N/A"),
+        "clouds": current["cloudcover"],
+        "visibility": current["visibility"],
+        "uv_index": current.get("uvindex", "N/A"),
+        "timestamp": current.get("datetime", "N/A")
+    }
+
+
+_INVALID_KEY = ("Invalid API key!", "Invalid API key")
+_BAD_REQUEST = ("Bad request - City '{city}' might be invalid", "Bad request")
+
+# Provider specs: "url" may contain a {city} placeholder, "params" builds the
+# per-call query params, and "errors" maps HTTP status to (printed, returned)
+_PROVIDERS = {
+    "openweathermap": {
+        "label": "OpenWeatherMap API",
+        "url": "https://api.openweathermap.org/data/2.5/weather",
+        "key_param": "appid",
+        "base_params": {},
+        "params": lambda city, units: {"q": city, "units": "metric" if units == "celsius" else "imperial"},
+        "parse": _parse_openweathermap,
+        "errors": {
+            401: _INVALID_KEY,
+            404: ("City '{city}' not found!", "City not found")
+        }
+    },
+    "weatherapi": {
+        "label": "WeatherAPI.com",
+        "url": "http://api.weatherapi.com/v1/current.json",
+        "key_param": "key",
+        "base_params": {"aqi": "yes"},
+        "params": lambda city, units: {"q": city},
+        "parse": _parse_weatherapi,
+        "errors": {
+            401: _INVALID_KEY,
+            403: _INVALID_KEY,
+            400: _BAD_REQUEST
+        }
+    },
+    "visualcrossing": {
+        "label": "Visual Crossing API",
+        "url": "https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline/{city}",
+        "key_param": "key",
+        "base_params": {"include": "current", "contentType": "json"},
+        "params": lambda city, units: {"unitGroup": "us" if units == "fahrenheit" else "metric"},
+        "parse": _parse_visualcrossing,
+        "errors": {
+            401: _INVALID_KEY,
+            400: _BAD_REQUEST
+        }
+    }
+}
 
 
 class WeatherAPITester:
     """Test weather API integration"""
     
     def __init__(self, api_key: Optional[str] = None, provider: str = "openweathermap"):
-        self.api_key = api_key or os.getenv("WEATHER_API_KEY")
+        self.api_key = api_key or _WEATHER_API_KEY
         self.provider = provider.lower()
-        self.client = httpx.AsyncClient(timeout=15.0)
+        self.client = _get_client()
+        
+        # Invariant query params per provider; only city/units vary between calls
+        self._base_params = {
+            name: {**spec["base_params"], spec["key_param"]: self.api_key}
+            for name, spec in _PROVIDERS.items()
+        }
+        
+        self._dispatch = {
+            "openweathermap": self.test_openweathermap,
+            "weatherapi": self.test_weatherapi,
+            "visualcrossing": self.test_visualcrossing
+        }
     
     def print_header(self, text: str):
         """Print colored header"""
-        print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*80}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{text.center(80)}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{'='*80}{Colors.ENDC}\n")
+        print(f"\n{_HEADER_SEP}\n{_HEADER_FMT % text.center(80)}\n{_HEADER_SEP}\n")
     
     def print_success(self, text: str):
         """Print success message"""
-        print(f"{Colors.OKGREEN}✓ {text}{Colors.ENDC}")
+        print(_SUCCESS_FMT % text)
     
     def print_error(self, text: str):
         """Print error message"""
-        print(f"{Colors.FAIL}✗ {text}{Colors.ENDC}")
+        print(_ERR_FMT % text)
     
     def print_warning(self, text: str):
         """Print warning message"""
-        print(f"{Colors.WARNING}⚠ {text}{Colors.ENDC}")
+        print(_WARN_FMT % text)
     
     def print_info(self, text: str):
         """Print info message"""
-        print(f"{Colors.OKCYAN}ℹ {text}{Colors.ENDC}")
+        print(_INFO_FMT % text)
     
-    async def test_openweathermap(self, city: str, units: str) -> Dict[str, Any]:
-        """Test OpenWeatherMap API"""
-        self.print_info(f"Testing OpenWeatherMap API for {city}...")
+    async def _get_json(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET a JSON endpoint, collecting the body as it streams in"""
+        buf = bytearray()
+        async with self.client.stream("GET", url, params=params) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(65536):
+                buf.extend(chunk)
+        # Both orjson and json accept a bytearray, so no extra bytes copy
+        return _loads(buf)
+    
+    async def _fetch(self, name: str, city: str, units: str) -> Dict[str, Any]:
+        """Query a provider described in _PROVIDERS and normalize its response"""
+        spec = _PROVIDERS[name]
+        self.print_info(f"Testing {spec['label']} for {city}...")
         
         if not self.api_key:
             self.print_error("No API key provided!")
             return {"success": False, "error": "No API key"}
         
-        api_units = "metric" if units == "celsius" else "imperial"
-        url = "https://api.openweathermap.org/data/2.5/weather"
-        params = {
-            "q": city,
-            "appid": self.api_key,
-            "units": api_units
-        }
+        url = spec["url"].format(city=city)
+        params = {**self._base_params[name], **spec["params"](city, units)}
         
         try:
-            response = await self.client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            result = {
-                "success": True,
-                "provider": "OpenWeatherMap",
-                "city": data["name"],
-                "country": data["sys"]["country"],
-                "temperature": round(data["main"]["temp"], 1),
-                "feels_like": round(data["main"]["feels_like"], 1),
-                "units": units,
-                "condition": data["weather"][0]["description"].title(),
-                "humidity": data["main"]["humidity"],
-                "pressure": data["main"]["pressure"],
-                "wind_speed": round(data["wind"]["speed"], 1),
-                "clouds": data["clouds"]["all"],
-                "visibility": data.get("visibility", "N/A"),
-                "timestamp": datetime.fromtimestamp(data["dt"]).strftime("%Y-%m-%d %H:%M:%S")
-            }
+            data = await self._get_json(url, params)
+            result = spec["parse"](data, units)
             
-            self.print_success("OpenWeatherMap API call successful!")
+            self.print_success(f"{spec['label']} call successful!")
             return result
             
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                self.print_error("Invalid API key!")
-                return {"success": False, "error": "Invalid API key", "status_code": 401}
-            elif e.response.status_code == 404:
-                self.print_error(f"City '{city}' not found!")
-                return {"success": False, "error": "City not found", "status_code": 404}
+            status_code = e.response.status_code
+            if status_code in spec["errors"]:
+                message, error = spec["errors"][status_code]
+                self.print_error(message.format(city=city))
+                return {"success": False, "error": error, "status_code": status_code}
             else:
-                self.print_error(f"HTTP error: {e.response.status_code}")
-                return {"success": False, "error": str(e), "status_code": e.response.status_code}
+                self.print_error(f"HTTP error: {status_code}")
+                return {"success": False, "error": str(e), "status_code": status_code}
         
         except Exception as e:
             self.print_error(f"Error: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    async def test_openweathermap(self, city: str, units: str) -> Dict[str, Any]:
+        """Test OpenWeatherMap API"""
+        return await self._fetch("openweathermap", city, units)
+    
     async def test_weatherapi(self, city: str, units: str) -> Dict[str, Any]:
         """Test WeatherAPI.com"""
-        self.print_info(f"Testing WeatherAPI.com for {city}...")
-        
-        if not self.api_key:
-            self.print_error("No API key provided!")
-            return {"success": False, "error": "No API key"}
-        
-        url = "http://api.weatherapi.com/v1/current.json"
-        params = {
-            "key": self.api_key,
-            "q": city,
-            "aqi": "yes"
-        }
-        
-        try:
-            response = await self.client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            temp = data["current"]["temp_c"] if units == "celsius" else data["current"]["temp_f"]
-            feels_like = data["current"]["feelslike_c"] if units == "celsius" else data["current"]["feelslike_f"]
-            
-            result = {
-                "success": True,
-                "provider": "WeatherAPI",
-                "city": data["location"]["name"],
-                "country": data["location"]["country"],
-                "region": data["location"]["region"],
-                "temperature": round(temp, 1),
-                "feels_like": round(feels_like, 1),
-                "units": units,
-                "condition": data["current"]["condition"]["text"],
-                "humidity": data["current"]["humidity"],
-                "pressure": data["current"]["pressure_mb"],
-                "wind_speed": round(data["current"]["wind_kph"] if units == "celsius" else data["current"]["wind_mph"], 1),
-                "wind_direction": data["current"]["wind_dir"],
-                "clouds": data["current"]["cloud"],
-                "visibility": data["current"]["vis_km"] if units == "celsius" else data["current"]["vis_miles"],
-                "uv_index": data["current"]["uv"],
-                "last_updated": data["current"]["last_updated"]
-            }
-            
-            self.print_success("WeatherAPI.com call successful!")
-            return result
-            
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401 or e.response.status_code == 403:
-                self.print_error("Invalid API key!")
-                return {"success": False, "error": "Invalid API key", "status_code": e.response.status_code}
-            elif e.response.status_code == 400:
-                self.print_error(f"Bad request - City '{city}' might be invalid")
-                return {"success": False, "error": "Bad request", "status_code": 400}
-            else:
-                self.print_error(f"HTTP error: {e.response.status_code}")
-                return {"success": False, "error": str(e), "status_code": e.response.status_code}
-        
-        except Exception as e:
-            self.print_error(f"Error: {str(e)}")
-            return {"success": False, "error": str(e)}
+        return await self._fetch("weatherapi", city, units)
     
     async def test_visualcrossing(self, city: str, units: str) -> Dict[str, Any]:
         """Test Visual Crossing Weather API"""
-        self.print_info(f"Testing Visual Crossing API for {city}...")
-        
-        if not self.api_key:
-            self.print_error("No API key provided!")
-            return {"success": False, "error": "No API key"}
-        
-        unit_group = "us" if units == "fahrenheit" else "metric"
-        url = f"https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline/{city}"
-        params = {
-            "key": self.api_key,
-            "unitGroup": unit_group,
-            "include": "current",
-            "contentType": "json"
-        }
-        
-        try:
-            response = await self.client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            current = data["currentConditions"]
-            
-            result = {
-                "success": True,
-                "provider": "Visual Crossing",
-                "city": data["resolvedAddress"],
-                "temperature": round(current["temp"], 1),
-                "feels_like": round(current["feelslike"], 1),
-                "units": units,
-                "condition": current["conditions"],
-                "humidity": current["humidity"],
-                "pressure": current["pressure"],
-                "wind_speed": round(current["windspeed"], 1),
-                "wind_direction": current.get("winddir", "N/A"),
-                "clouds": current["cloudcover"],
-                "visibility": current["visibility"],
-                "uv_index": current.get("uvindex", "N/A"),
-                "timestamp": current.get("datetime", "N/A")
-            }
-            
-            self.print_success("Visual Crossing API call successful!")
-            return result
-            
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                self.print_error("Invalid API key!")
-                return {"success": False, "error": "Invalid API key", "status_code": 401}
-            elif e.response.status_code == 400:
-                self.print_error(f"Bad request - City '{city}' might be invalid")
-                return {"success": False, "error": "Bad request", "status_code": 400}
-            else:
-                self.print_error(f"HTTP error: {e.response.status_code}")
-                return {"success": False, "error": str(e), "status_code": e.response.status_code}
-        
-        except Exception as e:
-            self.print_error(f"Error: {str(e)}")
-            return {"success": False, "error": str(e)}
+        return await self._fetch("visualcrossing", city, units)
     
     def display_weather_data(self, data: Dict[str, Any]):
         """Display weather data in a pretty format"""
@@ -249,43 +297,64 @@ class WeatherAPITester:
             self.print_error(f"Failed: {data.get('error', 'Unknown error')}")
             return
         
-        print(f"\n{Colors.OKBLUE}{Colors.BOLD}Weather Information:{Colors.ENDC}")
-        print(f"{Colors.BOLD}{'─'*80}{Colors.ENDC}")
+        bold, endc, okblue, okcyan = BOLD, ENDC, OKBLUE, OKCYAN
+        
+        # Unpack fields once up front
+        city = data.get('city')
+        country = data.get('country')
+        region = data.get('region')
+        temperature = data.get('temperature')
+        feels_like = data.get('feels_like')
+        condition = data.get('condition')
+        humidity = data.get('humidity')
+        wind_speed = data.get('wind_speed')
+        wind_direction = data.get('wind_direction')
+        pressure = data.get('pressure')
+        clouds = data.get('clouds')
+        visibility = data.get('visibility')
+        uv_index = data.get('uv_index')
+        provider = data.get('provider')
+        is_celsius = data.get('units') == 'celsius'
+        last_updated = data.get('timestamp', data.get('last_updated', 'N/A'))
+        
+        # Build the whole block and emit it with a single write
+        parts = [
+            f"\n{okblue}{bold}Weather Information:{endc}",
+            f"{bold}{'─'*80}{endc}"
+        ]
         
         # Basic info
-        print(f"📍 Location: {Colors.BOLD}{data.get('city')}{Colors.ENDC}", end="")
-        if data.get('country'):
-            print(f", {data.get('country')}")
-        else:
-            print()
+        location = f"📍 Location: {bold}{city}{endc}"
+        if country:
+            location += f", {country}"
+        parts.append(location)
         
-        if data.get('region'):
-            print(f"   Region: {data.get('region')}")
+        if region:
+            parts.append(f"   Region: {region}")
         
-        print(f"🌡️  Temperature: {Colors.BOLD}{data.get('temperature')}°{Colors.ENDC}", end="")
-        if data.get('units') == 'celsius':
-            print(" C")
-        else:
-            print(" F")
+        unit_suffix = "C" if is_celsius else "F"
+        parts.append(f"🌡️  Temperature: {bold}{temperature}°{endc} {unit_suffix}")
+        
+        parts.append(f"🤔 Feels Like: {feels_like}°")
+        parts.append(f"☁️  Condition: {bold}{condition}{endc}")
+        parts.append(f"💧 Humidity: {humidity}%")
+        parts.append(f"🌬️  Wind Speed: {wind_speed} {'km/h' if is_celsius else 'mph'}")
         
-        print(f"🤔 Feels Like: {data.get('feels_like')}°")
-        print(f"☁️  Condition: {Colors.BOLD}{data.get('condition')}{Colors.ENDC}")
-        print(f"💧 Humidity: {data.get('humidity')}%")
-        print(f"🌬️  Wind Speed: {data.get('wind_speed')} {'km/h' if data.get('units') == 'celsius' else 'mph'}")
+        if wind_direction:
+            parts.append(f"🧭 Wind Direction: {wind_direction}")
         
-        if data.get('wind_direction'):
-            print(f"🧭 Wind Direction: {data.get('wind_direction')}")
+        parts.append(f"📊 Pressure: {pressure} mb")
+        parts.append(f"☁️  Cloud Cover: {clouds}%")
+        parts.append(f"👁️  Visibility: {visibility}")
         
-        print(f"📊 Pressure: {data.get('pressure')} mb")
-        print(f"☁️  Cloud Cover: {data.get('clouds')}%")
-        print(f"👁️  Visibility: {data.get('visibility')}")
+        if uv_index:
+            parts.append(f"☀️  UV Index: {uv_index}")
         
-        if data.get('uv_index'):
-            print(f"☀️  UV Index: {data.get('uv_index')}")
+        parts.append(f"\n⏰ Last Updated: {last_updated}")
+        parts.append(f"🔌 Provider: {okcyan}{provider}{endc}")
+        parts.append(f"{bold}{'─'*80}{endc}\n")
         
-        print(f"\n⏰ Last Updated: {data.get('timestamp', data.get('last_updated', 'N/A'))}")
-        print(f"🔌 Provider: {Colors.OKCYAN}{data.get('provider')}{Colors.ENDC}")
-        print(f"{Colors.BOLD}{'─'*80}{Colors.ENDC}\n")
+        sys.stdout.write("\n".join(parts) + "\n")
     
     async def run_comprehensive_test(self, city: str = "London", units: str = "celsius"):
         """Run comprehensive test of weather API"""
@@ -300,30 +369,46 @@ class WeatherAPITester:
             self.print_info("Set WEATHER_API_KEY environment variable or pass --api-key")
             return
         
-        print(f"\nProvider: {Colors.BOLD}{self.provider}{Colors.ENDC}")
-        print(f"City: {Colors.BOLD}{city}{Colors.ENDC}")
-        print(f"Units: {Colors.BOLD}{units}{Colors.ENDC}\n")
+        print(f"\nProvider: {BOLD}{self.provider}{ENDC}")
+        print(f"City: {BOLD}{city}{ENDC}")
+        print(f"Units: {BOLD}{units}{ENDC}\n")
         
         # Test the selected provider
-        if self.provider == "openweathermap":
-            result = await self.test_openweathermap(city, units)
-        elif self.provider == "weatherapi":
-            result = await self.test_weatherapi(city, units)
-        elif self.provider == "visualcrossing":
-            result = await self.test_visualcrossing(city, units)
-        else:
+        handler = self._dispatch.get(self.provider)
+        if handler is None:
             self.print_error(f"Unknown provider: {self.provider}")
             self.print_info("Available providers: openweathermap, weatherapi, visualcrossing")
             return
         
+        result = await handler(city, units)
+        
         # Display results
         self.display_weather_data(result)
         
         # Save to file
         if result.get("success"):
-            filename = f"weather_test_{city.lower().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(filename, 'w') as f:
-                json.dump(result, f, indent=2)
+            slug = city.translate(_CITY_XLAT).lower()
+            filename = f"weather_test_{slug}_{time.strftime('%Y%m%d_%H%M%S')}.json"
+            try:
+                if orjson:
+                    payload = memoryview(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+                    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+                    fd = os.open(filename, flags, 0o644)
+                    try:
+                        # os.write may write fewer bytes than requested
+                        while payload:
+                            written = os.write(fd, payload)
+                            if written == 0:
+                                raise OSError("short write")
+                            payload = payload[written:]
+                    finally:
+                        os.close(fd)
+                else:
+                    with open(filename, 'w') as f:
+                        json.dump(result, f, indent=2)
+            except OSError as e:
+                self.print_error(f"Failed to save results to {filename}: {e}")
+                return
             self.print_success(f"Results saved to: {filename}")
     
     async def test_all_providers(self, city: str = "London", units: str = "celsius"):
@@ -334,40 +419,32 @@ class WeatherAPITester:
             self.print_error("No API key provided!")
             return
         
-        providers = ["openweathermap", "weatherapi", "visualcrossing"]
-        results = {}
+        providers = list(self._dispatch)
         
-        for provider in providers:
-            self.provider = provider
-            print(f"\n{Colors.BOLD}Testing {provider.upper()}...{Colors.ENDC}")
-            print(f"{Colors.BOLD}{'─'*80}{Colors.ENDC}")
-            
-            if provider == "openweathermap":
-                result = await self.test_openweathermap(city, units)
-            elif provider == "weatherapi":
-                result = await self.test_weatherapi(city, units)
-            elif provider == "visualcrossing":
-                result = await self.test_visualcrossing(city, units)
-            
+        # Providers are independent hosts, so query them all at once
+        tasks = [self._dispatch[provider](city, units) for provider in providers]
+        results_list = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        results = {}
+        for provider, result in zip(providers, results_list):
+            if isinstance(result, BaseException):
+                result = {"success": False, "error": str(result)}
             results[provider] = result
-            self.display_weather_data(result)
             
-            await asyncio.sleep(1)  # Rate limiting
+            print(f"\n{BOLD}Results for {provider.upper()}{ENDC}")
+            print(f"{BOLD}{'─'*80}{ENDC}")
+            self.display_weather_data(result)
         
         # Summary
         self.print_header("Test Summary")
         for provider, result in results.items():
             status = "✓ SUCCESS" if result.get("success") else "✗ FAILED"
-            color = Colors.OKGREEN if result.get("success") else Colors.FAIL
-            print(f"{color}{provider.upper()}: {status}{Colors.ENDC}")
+            color = OKGREEN if result.get("success") else FAIL
+            print(f"{color}{provider.upper()}: {status}{ENDC}")
             if not result.get("success"):
                 print(f"  Error: {result.get('error')}")
         print()
     
-    async def close(self):
-        """Close HTTP client"""
-        await self.client.aclose()
-
 
 async def main():
     """Main entry point"""
@@ -383,7 +460,7 @@ async def main():
     
     args = parser.parse_args()
     
-    tester = WeatherAPITester(api_key=os.getenv("WEATHER_API_KEY"), provider=args.provider)
+    tester = WeatherAPITester(api_key=_WEATHER_API_KEY, provider=args.provider)
     
     try:
         if args.test_all:
@@ -391,12 +468,21 @@ async def main():
         else:
             await tester.run_comprehensive_test(args.city, args.units)
     finally:
-        await tester.close()
+        await aclose_shared()
 
 
 if __name__ == "__main__":
+    # Faster event loop when available (not supported on Windows)
     try:
-        asyncio.run(main())
+        import uvloop
+    except ImportError:
+        uvloop = None
+    
+    try:
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
-        print(f"\n{Colors.WARNING}Test interrupted by user{Colors.ENDC}")
+        print(f"\n{WARNING}Test interrupted by user{ENDC}")
         sys.exit(0)
\ No newline at end of file
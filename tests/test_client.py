@@ -0,0 +1,62 @@
+"""
+Tests for MCPClient conversation history handling
+"""
+
+import pytest
+from backend.mcp.client import MCPClient
+
+
+class DummyServer:
+    async def list_tools(self):
+        return []
+
+
+@pytest.fixture
+def client():
+    return MCPClient(api_key="test-key", server=DummyServer())
+
+
+def _msg(role):
+    return {"role": role, "content": role}
+
+
+def _roles(history):
+    return [m["role"] for m in history]
+
+
+def test_trim_history_keeps_short_history(client):
+    client.conversation_history += [_msg("user"), _msg("assistant")]
+    client._trim_history()
+    assert _roles(client.conversation_history) == ["system", "user", "assistant"]
+
+
+def test_trim_history_skips_past_completed_tool_group(client):
+    client.conversation_history += [
+        _msg("user"),
+        _msg("assistant"),
+        _msg("tool"),
+        _msg("tool"),
+        _msg("assistant"),
+        _msg("user"),
+    ]
+    client.max_history_messages = 3
+
+    client._trim_history()
+
+    # The cut lands on the first tool reply; the whole group goes with its
+    # assistant message instead of leaving orphaned tool replies
+    assert _roles(client.conversation_history) == ["system", "assistant", "user"]
+
+
+def test_trim_history_keeps_pending_tool_group(client):
+    client.conversation_history += [
+        _msg("user"),
+        _msg("assistant"),
+        _msg("tool"),
+        _msg("tool"),
+    ]
+    client.max_history_messages = 1
+
+    client._trim_history()
+
+    assert _roles(client.conversation_history) == ["system", "assistant", "tool", "tool"]
@@ -0,0 +1,68 @@
+"""
+Tests for MCP server tools
+"""
+
+import asyncio
+import pytest
+from backend.mcp.tools.weather import WeatherTool
+
+
+@pytest.fixture
+def weather_tool():
+    tool = WeatherTool(api_key="test-key", provider="openweathermap")
+    tool.calls = []
+
+    async def fake_fetch(city, units):
+        tool.calls.append(city)
+        await asyncio.sleep(0.01)
+        if city == "Nowhere":
+            return {"success": False, "error": "City not found"}
+        return {"success": True, "city": city, "units": units}
+
+    tool._fetch = fake_fetch
+    return tool
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_fetch(weather_tool):
+    results = await asyncio.gather(
+        *[weather_tool._fetch_cached("London", "celsius") for _ in range(5)]
+    )
+
+    assert weather_tool.calls == ["London"]
+    assert all(r["city"] == "London" for r in results)
+    assert weather_tool._cache_locks == {}
+    assert weather_tool._cache_lock_users == {}
+
+
+@pytest.mark.asyncio
+async def test_cached_entry_expires(weather_tool):
+    await weather_tool._fetch_cached("London", "celsius")
+    await weather_tool._fetch_cached("London", "celsius")
+    assert weather_tool.calls == ["London"]
+
+    weather_tool._cache_ttl = 0
+    await weather_tool._fetch_cached("London", "celsius")
+    assert weather_tool.calls == ["London", "London"]
+    assert len(weather_tool._cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_oldest_beyond_max_size(weather_tool):
+    weather_tool._cache_max_size = 2
+
+    for city in ["London", "Paris", "Tokyo"]:
+        await weather_tool._fetch_cached(city, "celsius")
+
+    assert [key[1] for key in weather_tool._cache] == ["paris", "tokyo"]
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_cached(weather_tool):
+    result = await weather_tool._fetch_cached("Nowhere", "celsius")
+    await weather_tool._fetch_cached("Nowhere", "celsius")
+
+    assert result["success"] is False
+    assert weather_tool.calls == ["Nowhere", "Nowhere"]
+    assert len(weather_tool._cache) == 0
+    assert weather_tool._cache_locks == {}